@@ -1,4 +1,8 @@
 from __future__ import annotations
+import json
+import os
+import re
+import string
 from typing import Optional, Tuple
 from PySide6 import QtWidgets, QtCore, QtGui
 from serial_location_reader import SerialLocationReader
@@ -6,6 +10,7 @@ from serial_location_reader import SerialLocationReader
 # Try to use the embedded browser for the map (Leaflet)
 try:
     from PySide6.QtWebEngineWidgets import QWebEngineView
+    from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage
     WEB_OK = True
 except Exception:
     WEB_OK = False
@@ -23,65 +28,89 @@ ACCENT    = "#7CFC99"
 WARN      = "#ffd166"
 ERR       = "#ff6b6b"
 
-APP_QSS = f"""
-QMainWindow {{ background:{BG}; color:{TEXT}; font-family:Segoe UI,Inter,system-ui,Arial; font-size:13px; }}
-QGroupBox {{ background:{CARD}; border:1px solid {BORDER}; border-radius:14px; margin-top:12px; padding:10px; }}
-QGroupBox::title {{ subcontrol-origin: margin; left:14px; top:2px; color:{MUTED}; padding:0 6px; background:{CARD_DARK}; border-radius:8px; }}
-QLabel#title {{ color:{MUTED}; }}
-QLabel[value="true"] {{ color:{ACCENT}; font-weight:600; }}
-QSplitter::handle {{ background:{BG}; width:6px; }}
+APP_QSS_TMPL = """
+QMainWindow { background:$BG; color:$TEXT; font-family:Segoe UI,Inter,system-ui,Arial; font-size:13px; }
+QGroupBox { background:$CARD; border:1px solid $BORDER; border-radius:14px; margin-top:12px; padding:10px; }
+QGroupBox::title { subcontrol-origin: margin; left:14px; top:2px; color:$MUTED; padding:0 6px; background:$CARD_DARK; border-radius:8px; }
+QLabel#title { color:$MUTED; }
+QLabel[value="true"] { color:$ACCENT; font-weight:600; }
+QSplitter::handle { background:$BG; width:6px; }
 """
+APP_QSS = string.Template(APP_QSS_TMPL).substitute(
+    BG=BG, CARD=CARD, CARD_DARK=CARD_DARK, BORDER=BORDER, TEXT=TEXT, MUTED=MUTED, ACCENT=ACCENT)
 
 MODE_NAMES = {0: "MANUAL", 1: "STABILIZE", 2: "ALT HOLD", 3: "LOITER", 4: "AUTO"}
 
+# pre-compiled JS templates for the hot flush path
+_DRONE_TMPL = "setDrone(%.7f,%.7f,%.1f,%s,%s,%s);"
+_BOOL = {True: "true", False: "false"}
+
+_TAG_GAP = re.compile(r">\s+<")
+
+
+def _minify(html: str) -> str:
+    # Shrink the setHtml payload once at import: fewer bytes over IPC to the
+    # render process and less for V8/Blink to parse. Only whole-line comments
+    # are dropped so template literals and URLs are left untouched.
+    out = []
+    for ln in html.split("\n"):
+        s = ln.strip()
+        if not s:
+            continue
+        if s.startswith("//") or (s.startswith("/*") and s.endswith("*/")):
+            continue
+        out.append(s)
+    return _TAG_GAP.sub("><", "\n".join(out))
+
+
 # ---------------- Leaflet page ----------------
-LEAFLET_HTML = f"""
+LEAFLET_HTML_TMPL = """
 <!doctype html><html><head>
 <meta charset='utf-8'><meta name='viewport' content='initial-scale=1,width=device-width'>
 <link rel='stylesheet' href='https://unpkg.com/leaflet@1.9.4/dist/leaflet.css'>
 <script src='https://unpkg.com/leaflet@1.9.4/dist/leaflet.js'></script>
 <style>
-  html,body {{height:100%; margin:0; background:{BG}; display:flex; flex-direction:column;}}
-  #map {{ flex:1 1 auto; width:100%; background:#0a0f14; }}
-  #map .leaflet-tile {{ image-rendering:auto; }}
+  html,body {height:100%; margin:0; background:$BG; display:flex; flex-direction:column;}
+  #map { flex:1 1 auto; width:100%; background:#0a0f14; }
+  #map .leaflet-tile { image-rendering:auto; }
 
-  #coordbar {{
-      height:36px; background:#000; color:{ACCENT}; border-top:1px solid #222;
+  #coordbar {
+      height:36px; background:#000; color:$ACCENT; border-top:1px solid #222;
       display:flex; align-items:center; gap:10px; padding:0 14px; font:15px Consolas,monospace;
-  }}
-  #coord {{ color:{ACCENT}; }}
-  #conn {{
-      margin-left:auto; padding:4px 10px; border-radius:12px; border:1px solid {BORDER};
-      background:{CARD_DARK}cc; color:{TEXT}; font:13px Consolas,monospace;
-  }}
-  #conn.ok {{ color:{ACCENT}; }} #conn.wait {{ color:{WARN}; }} #conn.err {{ color:{ERR}; }}
+  }
+  #coord { color:$ACCENT; }
+  #conn {
+      margin-left:auto; padding:4px 10px; border-radius:12px; border:1px solid $BORDER;
+      background:${CARD_DARK}cc; color:$TEXT; font:13px Consolas,monospace;
+  }
+  #conn.ok { color:$ACCENT; } #conn.wait { color:$WARN; } #conn.err { color:$ERR; }
 
   /* Drone icon */
-  .drone-icon{{ width:56px; height:56px; position:relative;
+  .drone-icon{ width:56px; height:56px; position:relative;
     transform-origin:50% 50%; transform: translateZ(0);
     will-change: transform;
     pointer-events:none; z-index:10000;
     filter: drop-shadow(0 1px 3px rgba(0,0,0,.75));
-  }}
-  .drone-icon svg{{ width:56px; height:56px; display:block; }}
+  }
+  .drone-icon svg{ width:56px; height:56px; display:block; }
 
-  .pulse{{ position:absolute; left:50%; top:50%;
+  .pulse{ position:absolute; left:50%; top:50%;
     width:64px; height:64px; margin:-32px 0 0 -32px; border-radius:50%;
     background:rgba(0,214,255,.18); box-shadow:0 0 0 0 rgba(0,214,255,.45);
     animation:pulse 1.6s ease-out infinite;
-  }}
-  @keyframes pulse{{
-    0%   {{ transform:scale(.55); box-shadow:0 0 0 0 rgba(0,214,255,.45); }}
-    70%  {{ transform:scale(1);   box-shadow:0 0 0 18px rgba(0,214,255,0); }}
-    100% {{ transform:scale(.55); box-shadow:0 0 0 0 rgba(0,214,255,0); }}
-  }}
+  }
+  @keyframes pulse{
+    0%   { transform:scale(.55); box-shadow:0 0 0 0 rgba(0,214,255,.45); }
+    70%  { transform:scale(1);   box-shadow:0 0 0 18px rgba(0,214,255,0); }
+    100% { transform:scale(.55); box-shadow:0 0 0 0 rgba(0,214,255,0); }
+  }
 
-  .altTip {{ background:#0000; border:none; box-shadow:none; color:#fff; font-weight:700;
-             text-shadow:0 1px 3px #000; font-family:Segoe UI,Arial; }}
-  .leaflet-control-attribution {{ font-size:11px; opacity:.85; }}
+  .altTip { background:#0000; border:none; box-shadow:none; color:#fff; font-weight:700;
+             text-shadow:0 1px 3px #000; font-family:Segoe UI,Arial; }
+  .leaflet-control-attribution { font-size:11px; opacity:.85; }
 
   /* Move Leaflet controls to bottom-right with margin */
-  .leaflet-bottom.leaflet-right {{ margin:0 10px 48px 0; }}
+  .leaflet-bottom.leaflet-right { margin:0 10px 48px 0; }
 </style></head><body>
 <div id='map'></div>
 <div id='coordbar'>
@@ -89,63 +118,88 @@ LEAFLET_HTML = f"""
   <span id='conn' class='wait'>Connecting…</span>
 </div>
 <script>
-  var map = L.map('map', {{
+  var map = L.map('map', {
     worldCopyJump:true,
     zoomControl:true,
     zoomAnimation:false,
     markerZoomAnimation:false,
     fadeAnimation:false,
     zoomSnap:1,
-    scrollWheelZoom:true
-  }});
+    scrollWheelZoom:true,
+    preferCanvas:true,
+    trackResize:false
+  });
   map.setView([0,0], 2);
 
-  var osmStandard = L.tileLayer('https://{{s}}.tile.openstreetmap.org/{{z}}/{{x}}/{{y}}.png', {{
-    maxZoom: 19, detectRetina: false, updateWhenIdle: true, keepBuffer: 6,
+  var osmStandard = L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+    maxZoom: 19, detectRetina: false, updateWhenIdle: true, updateWhenZooming: false, keepBuffer: 6,
     attribution: '&copy; OpenStreetMap contributors'
-  }});
+  });
 
-  var cartoLight = L.tileLayer('https://{{s}}.basemaps.cartocdn.com/light_all/{{z}}/{{x}}/{{y}}{{r}}.png', {{
-    maxZoom: 20, detectRetina: false, keepBuffer: 6,
+  var cartoLight = L.tileLayer('https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png', {
+    maxZoom: 20, detectRetina: false, updateWhenIdle: true, updateWhenZooming: false, keepBuffer: 6,
     attribution: '&copy; OpenStreetMap contributors &copy; CARTO'
-  }});
+  });
 
-  var cartoDark = L.tileLayer('https://{{s}}.basemaps.cartocdn.com/dark_all/{{z}}/{{x}}/{{y}}{{r}}.png', {{
-    maxZoom: 20, detectRetina: false, keepBuffer: 6,
+  var cartoDark = L.tileLayer('https://{s}.basemaps.cartocdn.com/dark_all/{z}/{x}/{y}{r}.png', {
+    maxZoom: 20, detectRetina: false, updateWhenIdle: true, updateWhenZooming: false, keepBuffer: 6,
     attribution: '&copy; OpenStreetMap contributors &copy; CARTO'
-  }});
+  });
 
-  var osmHOT = L.tileLayer('https://{{s}}.tile.openstreetmap.fr/hot/{{z}}/{{x}}/{{y}}.png', {{
-    maxZoom: 20, detectRetina: false, keepBuffer: 6,
+  var osmHOT = L.tileLayer('https://{s}.tile.openstreetmap.fr/hot/{z}/{x}/{y}.png', {
+    maxZoom: 20, detectRetina: false, updateWhenIdle: true, updateWhenZooming: false, keepBuffer: 6,
     attribution: '&copy; OpenStreetMap France, &copy; OpenStreetMap contributors'
-  }});
+  });
 
   var base = cartoLight.addTo(map);
 
   L.control.layers(
-    {{
+    {
       'Carto Light (labels clear)': cartoLight,
       'Carto Dark': cartoDark,
       'OSM Standard': osmStandard,
       'OSM Humanitarian': osmHOT
-    }},
-    {{}},
-    {{ position: 'bottomright', collapsed: true }}
+    },
+    {},
+    { position: 'bottomright', collapsed: true }
   ).addTo(map);
 
-  var path = L.polyline([], {{color:'red', weight:3, opacity:0.9}}).addTo(map);
+  // canvas renderer: one draw per frame instead of N SVG path updates
+  var path = L.polyline([], {color:'red', weight:3, opacity:0.9, renderer:L.canvas()}).addTo(map);
   var marker=null, altTip=null, iconEl=null, lastPt=null;
+
+  // bounded trail: ring buffer flushed at most once per animation frame
+  var TRAIL_MAX = 2000;
+  var trailBuf = [], trailDirty = false, trailRafQueued = false;
+
+  function flushTrail(){
+    trailRafQueued = false;
+    if (trailDirty) {
+      path.setLatLngs(trailBuf);
+      trailDirty = false;
+    }
+  }
+
+  function pushTrailPoint(pt){
+    trailBuf.push(pt);
+    if (trailBuf.length > TRAIL_MAX) trailBuf.shift();
+    trailDirty = true;
+    if (!trailRafQueued) {
+      trailRafQueued = true;
+      requestAnimationFrame(flushTrail);
+    }
+  }
   var coordEl = document.getElementById('coord');
   var connEl  = document.getElementById('conn');
 
-  function setConn(text,state){{
+  function setConn(text,state){
     if(!connEl) return;
     connEl.textContent=text||'';
     connEl.classList.remove('ok','wait','err');
     connEl.classList.add(state==1?'ok':state==0?'wait':'err');
-  }}
+  }
 
-  function droneSVG(){{
+  function droneSVG(){
     return `
     <div class="drone-icon">
       <div class="pulse"></div>
@@ -162,50 +216,84 @@ LEAFLET_HTML = f"""
         <circle cx="32" cy="32" r="7.5" fill="#ffffff" stroke="#111" stroke-width="1.8"/>
       </svg>
     </div>`;
-  }}
-
-  function ensureMarker(lat, lon){{
-    if(!marker){{
-      const icon = L.divIcon({{
-        className:'', html:droneSVG(),
-        iconSize:[56,56], iconAnchor:[28,28]
-      }});
-      marker = L.marker([lat,lon], {{icon, zIndexOffset:10000}}).addTo(map);
-      altTip = L.tooltip({{permanent:true, direction:'bottom', className:'altTip', offset:[0,28]}})
+  }
+
+  // parse the SVG once; marker recreation reuses the same divIcon
+  var DRONE_ICON_HTML = droneSVG();
+  var DRONE_ICON = L.divIcon({
+    className:'', html:DRONE_ICON_HTML,
+    iconSize:[56,56], iconAnchor:[28,28]
+  });
+
+  function ensureMarker(lat, lon){
+    if(!marker){
+      marker = L.marker([lat,lon], {icon:DRONE_ICON, zIndexOffset:10000}).addTo(map);
+      altTip = L.tooltip({permanent:true, direction:'bottom', className:'altTip', offset:[0,28]})
                 .setLatLng([lat,lon]).setContent('').addTo(map);
       if(path.bringToBack) path.bringToBack();
       if(marker.bringToFront) marker.bringToFront();
       const root = marker.getElement ? marker.getElement() : (marker._icon||null);
       iconEl = root ? root.querySelector('.drone-icon') : null;
-    }}
-  }}
-
-  function setDrone(lat, lon, yawDeg, alt, jump, trail){{
+    }
+  }
+
+  // marker/tooltip/view moves are coalesced into one animation frame
+  var pendingPos=null, pendingAlt, pendingView=null, rafQueued=false;
+  var lastYaw=NaN, lastAltStr=null;
+
+  function rafFlush(){
+    rafQueued = false;
+    if (pendingPos) {
+      marker.setLatLng(pendingPos);
+      if (altTip) altTip.setLatLng(pendingPos);
+      pendingPos = null;
+    }
+    if (pendingAlt !== undefined) {
+      if (altTip) altTip.setContent(pendingAlt);
+      pendingAlt = undefined;
+    }
+    if (pendingView) {
+      map.setView([pendingView[0], pendingView[1]], pendingView[2]);
+      pendingView = null;
+    }
+  }
+
+  function scheduleFrame(){
+    if (!rafQueued) {
+      rafQueued = true;
+      requestAnimationFrame(rafFlush);
+    }
+  }
+
+  function setDrone(lat, lon, yawDeg, alt, jump, trail){
     ensureMarker(lat, lon);
-    marker.setLatLng([lat,lon]);
-    if (iconEl) {{
-      iconEl.style.transform = 'rotate(' + (yawDeg||0) + 'deg) translateZ(0)';
-    }}
-    if (altTip) {{
-      altTip.setLatLng([lat,lon]).setContent(alt != null ? (Math.round(alt) + ' m') : '');
-    }}
-    if (trail) {{
+    pendingPos = L.latLng(lat,lon);
+    var y = yawDeg || 0;
+    if (iconEl && !(Math.abs(y - lastYaw) <= 0.25)) {
+      iconEl.style.transform = 'rotate(' + y + 'deg) translateZ(0)';
+      lastYaw = y;
+    }
+    var altStr = alt != null ? (Math.round(alt) + ' m') : '';
+    if (altStr !== lastAltStr) {
+      pendingAlt = altStr;
+      lastAltStr = altStr;
+    }
+    if (trail) {
       var pt = L.latLng(lat,lon);
-      if (!lastPt || pt.distanceTo(lastPt) > 0.5) {{
-        path.addLatLng(pt);
+      if (!lastPt || pt.distanceTo(lastPt) > 0.5) {
+        pushTrailPoint(pt);
         lastPt = pt;
-      }}
-    }}
-    if (jump) {{
+      }
+    }
+    if (jump) {
       var z = map.getZoom();
-      map.setView([lat,lon], (z && z > 2) ? z : 13);
-    }}
+      pendingView = [lat, lon, (z && z > 2) ? z : 13];
+    }
     if (coordEl) coordEl.textContent = lat.toFixed(5) + ', ' + lon.toFixed(5);
-    if (marker.bringToFront) marker.bringToFront();
-    if (marker.setZIndexOffset) marker.setZIndexOffset(10000);
-  }}
+    scheduleFrame();
+  }
 
-  function invalidateMap() {{ try {{ map.invalidateSize(true); }} catch(e) {{}} }}
+  function invalidateMap() { try { map.invalidateSize(true); } catch(e) {} }
   window.addEventListener('resize', invalidateMap);
 
   window.setConn  = setConn;
@@ -215,6 +303,8 @@ LEAFLET_HTML = f"""
   setConn('Initializing…', 0);
 </script></body></html>
 """
+LEAFLET_HTML = _minify(string.Template(LEAFLET_HTML_TMPL).substitute(
+    BG=BG, CARD_DARK=CARD_DARK, BORDER=BORDER, TEXT=TEXT, ACCENT=ACCENT, WARN=WARN, ERR=ERR))
 # ---------------- Map widget with throttled JS + maximize button ----------------
 class MapView(QtWidgets.QWidget):
     """
@@ -237,7 +327,7 @@ class MapView(QtWidgets.QWidget):
         v.addStretch(1)
         self.stack.addWidget(self.offline)
 
-        # web view
+        # web view (created lazily in use_web: Chromium startup is expensive)
         self.web: QWebEngineView | None = None
         self._ready = False
 
@@ -250,14 +340,9 @@ class MapView(QtWidgets.QWidget):
         self._flush.setInterval(66)
         self._flush.timeout.connect(self._flush_tick)
 
-        if WEB_OK:
-            self.web = QWebEngineView(self)
-            self.web.loadFinished.connect(self._on_load)
-            self.web.setHtml(LEAFLET_HTML)
-            self.stack.addWidget(self.web)
-            self.stack.setCurrentWidget(self.web)
-        else:
-            self.stack.setCurrentWidget(self.offline)
+        self.stack.setCurrentWidget(self.offline)
+        # cached "web view is the current stack page" flag; updated in use_web
+        self._web_is_current = False
 
         # overlay maximize button (⤢ / ⤡)
         self.maxBtn = QtWidgets.QToolButton(self)
@@ -272,7 +357,52 @@ class MapView(QtWidgets.QWidget):
         )
         self.maxBtn.clicked.connect(self.toggleMaximize)
 
+        # window-visibility hook (installed once the native window exists)
+        self._vis_hooked = False
+
+        # debounce resize-driven invalidates: a drag-resize produces one
+        # invalidateMap call at the end instead of one per frame
+        self._resize_debounce = QtCore.QTimer(self)
+        self._resize_debounce.setSingleShot(True)
+        self._resize_debounce.setInterval(50)
+        self._resize_debounce.timeout.connect(self._invalidate_map)
+
     # --- lifecycle ---
+    def _invalidate_map(self):
+        self._run_js("invalidateMap();")
+
+    def _should_flush(self) -> bool:
+        return bool(self.web and self._ready and self._web_is_current)
+
+    def showEvent(self, e: QtGui.QShowEvent) -> None:
+        super().showEvent(e)
+        self._hook_window_visibility()
+        if self.web:
+            self.web.setVisible(self._web_is_current)
+        if self._should_flush() and not self._flush.isActive():
+            self._flush.start()
+
+    def hideEvent(self, e: QtGui.QHideEvent) -> None:
+        super().hideEvent(e)
+        self._flush.stop()
+        if self.web:
+            # explicit hide lets Chromium throttle the renderer
+            self.web.setVisible(False)
+
+    def _hook_window_visibility(self):
+        if self._vis_hooked:
+            return
+        wh = self.window().windowHandle()
+        if wh is not None:
+            wh.visibilityChanged.connect(self._on_window_visibility)
+            self._vis_hooked = True
+
+    def _on_window_visibility(self, vis):
+        if vis == QtGui.QWindow.Visibility.Minimized:
+            self._flush.stop()
+        elif self.isVisible() and self._should_flush() and not self._flush.isActive():
+            self._flush.start()
+
     def _on_load(self, ok: bool):
         self._ready = bool(ok)
         if self._ready and self.web:
@@ -282,26 +412,63 @@ class MapView(QtWidgets.QWidget):
                 self._flush.start()
 
     def _run_js(self, code: str):
-        if self.web and self._ready and self.stack.currentWidget() is self.web:
-            self.web.page().runJavaScript(code)
+        # callers gate on _web_is_current; only guard page readiness here
+        if self.web and self._ready:
+            # worldId overload is fire-and-forget: no result marshaled back
+            self.web.page().runJavaScript(code, 0)
+
+    @staticmethod
+    def _js_str(text: str) -> str:
+        # json.dumps is C-level and escapes quotes/control chars correctly
+        return json.dumps(text or "")
 
     def _flush_tick(self):
+        # dormant when the offline placeholder is showing; the timer should
+        # already be stopped, but never pay format/escape costs regardless
+        if not self._web_is_current:
+            return
+        # batch conn + drone into one runJavaScript call (one IPC hop)
+        parts: list[str] = []
+
         if self._pending_conn is not None:
             text, state = self._pending_conn
-            t = (text or "").replace("\\", "\\\\").replace("'", "\\'")
-            self._run_js(f"setConn('{t}', {int(state)});")
+            parts.append(f"setConn({self._js_str(text)}, {int(state)});")
             self._pending_conn = None
 
         if self._pending_drone is not None:
             lat, lon, yaw, alt, jump, trail = self._pending_drone
-            y = 0.0 if yaw is None else float(yaw)
-            a = "null" if alt is None else f"{float(alt):.1f}"
-            self._run_js(f"setDrone({lat:.7f},{lon:.7f},{y:.1f},{a},{str(bool(jump)).lower()},{str(bool(trail)).lower()});")
+            y = 0.0 if yaw is None else yaw
+            a = "null" if alt is None else "%.1f" % alt
+            parts.append(_DRONE_TMPL % (lat, lon, y, a, _BOOL[jump], _BOOL[trail]))
             self._pending_drone = None
 
+        if parts:
+            self._run_js("".join(parts))
+
     # --- External control ---
+    def _ensure_web(self) -> bool:
+        if self.web is not None:
+            return True
+        if not WEB_OK:
+            return False
+        self.web = QWebEngineView(self)
+        # persistent profile so OSM tiles survive restarts instead of
+        # re-downloading on every launch (default profile is off-the-record)
+        prof = QWebEngineProfile("drone_monitor_cache", self)
+        prof.setCachePath(os.path.expanduser("~/.cache/drone_monitor"))
+        prof.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        prof.setHttpCacheMaximumSize(256 * 1024 * 1024)
+        self.web.setPage(QWebEnginePage(prof, self.web))
+        self.web.loadFinished.connect(self._on_load)
+        self.web.setHtml(LEAFLET_HTML)
+        self.stack.addWidget(self.web)
+        return True
+
     def use_web(self, enabled: bool):
-        self.stack.setCurrentWidget(self.web if (enabled and self.web) else self.offline)
+        if enabled:
+            enabled = self._ensure_web()
+        self._web_is_current = bool(enabled and self.web)
+        self.stack.setCurrentWidget(self.web if self._web_is_current else self.offline)
         if enabled and self.web and self._ready and not self._flush.isActive():
             self._flush.start()
         if not enabled and self._flush.isActive():
@@ -309,12 +476,18 @@ class MapView(QtWidgets.QWidget):
         self._run_js("invalidateMap();")
 
     def is_web_active(self) -> bool:
-        return self.stack.currentWidget() is self.web
+        return self._web_is_current
 
     # --- Telemetry hooks (throttled) ---
     @QtCore.Slot(float, float, object, object, bool, bool)
     def set_drone(self, lat: float, lon: float, yaw_deg: float | None, alt: float | None, jump: bool, trail: bool = True):
-        self._pending_drone = (float(lat), float(lon), yaw_deg, alt, bool(jump), bool(trail))
+        # cast once here so the flush tick only formats
+        self._pending_drone = (
+            float(lat), float(lon),
+            None if yaw_deg is None else float(yaw_deg),
+            None if alt is None else float(alt),
+            bool(jump), bool(trail),
+        )
 
     @QtCore.Slot(str, int)
     def set_conn(self, text: str, state: int):
@@ -329,11 +502,14 @@ class MapView(QtWidgets.QWidget):
         self.maxBtn.adjustSize()
         m = 10
         self.maxBtn.move(self.width() - self.maxBtn.width() - m, m)
-        # force Leaflet to recalc tiles exactly on any resize
-        QtCore.QTimer.singleShot(0, lambda: self._run_js("invalidateMap();"))
+        # force Leaflet to recalc tiles once the resize settles
+        self._resize_debounce.start()
 
 # ---------------- Main window ----------------
 class MainWindow(QtWidgets.QMainWindow):
+    # emitted from a worker thread once the tile-server probe finishes
+    webmapResolved = QtCore.Signal(bool)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("GUI")
@@ -405,10 +581,27 @@ class MainWindow(QtWidgets.QMainWindow):
         self._port = "N/A"; self._baud = 0
         self._conn_state: int | None = None
         self.follow_mode = True
+        # last lat/lon actually sent to the map (dedupe gate)
+        self._last_sent_lat: float | None = None
+        self._last_sent_lon: float | None = None
+
+        # last formatted text per label; setText is skipped when unchanged
+        self._last_text: dict[str, str] = {}
+
+        # coalesce telemetry packets; widgets are refreshed at ~15 Hz,
+        # keeping only the newest value per field
+        self._pkt_cache: dict = {}
+        self._ui_flush = QtCore.QTimer(self)
+        self._ui_flush.setInterval(66)
+        self._ui_flush.timeout.connect(self._apply_pkt_cache)
+        self._ui_flush.start()
 
         # Initial banner
         self._update_banner(False)
 
+        # queued connection: safe to emit from any thread
+        self.webmapResolved.connect(self.map.use_web)
+
     # ---- helpers ----
     def _set_banner_color(self, color: str):
         self.bannerFill.setStyleSheet(f"QFrame#statusBanner {{ background:{color}; border-radius:12px; }}")
@@ -429,6 +622,8 @@ class MainWindow(QtWidgets.QMainWindow):
             t = QtWidgets.QLabel(name); t.setObjectName("title")
             t.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
             v = vlabel(); grid.addWidget(t, r, 0); grid.addWidget(v, r, 1); self._labels[key] = v
+            # direct attribute for the hot telemetry path (skips dict lookup)
+            setattr(self, f"_lbl_{key}", v)
         g.setLayout(grid)
         return g
 
@@ -445,7 +640,7 @@ class MainWindow(QtWidgets.QMainWindow):
                                                 logfile, binfile, hexdump, hexwidth, self)
         self.serialThread.locationReceived.connect(self._on_location)
         self.serialThread.telemetryReceived.connect(self._on_telemetry)
-        self.serialThread.lineReceived.connect(self._on_serial_line)
+        self.serialThread.linesReceived.connect(self._on_serial_lines)
         self.serialThread.start()
 
     def _set_conn(self, state: int):
@@ -455,47 +650,78 @@ class MainWindow(QtWidgets.QMainWindow):
                               ("Connected" if state==1 else "Connecting…" if state==0 else "ERROR"),
                               state)
 
+    def _latlon_changed(self, lat: float, lon: float) -> bool:
+        # ~1 cm epsilon; skip redundant map updates for a hovering drone
+        if self._last_sent_lat is None or self._last_sent_lon is None:
+            return True
+        return abs(lat - self._last_sent_lat) > 1e-7 or abs(lon - self._last_sent_lon) > 1e-7
+
     @QtCore.Slot(float, float)
     def _on_location(self, lat: float, lon: float):
         self._set_conn(1)
-        self._labels["lat"].setText(f"{lat:.6f}")
-        self._labels["lon"].setText(f"{lon:.6f}")
-        jump = (not self._got_first_fix) or self.follow_mode
-        self.map.set_drone(lat, lon, yaw_deg=self._last_yaw_val, alt=self._last_alt, jump=jump, trail=True)
+        self._set_text("lat", self._lbl_lat, f"{lat:.6f}")
+        self._set_text("lon", self._lbl_lon, f"{lon:.6f}")
+        if self._latlon_changed(lat, lon) or not self._got_first_fix:
+            jump = (not self._got_first_fix) or self.follow_mode
+            self.map.set_drone(lat, lon, yaw_deg=self._last_yaw_val, alt=self._last_alt, jump=jump, trail=True)
+            self._last_sent_lat, self._last_sent_lon = lat, lon
         self._got_first_fix = True
 
+    def _set_text(self, key: str, lbl: QtWidgets.QLabel, s: str):
+        # QLabel.setText invalidates layout even for identical text
+        if self._last_text.get(key) != s:
+            lbl.setText(s)
+            self._last_text[key] = s
+
     @QtCore.Slot(object)
     def _on_telemetry(self, pkt: dict):
-        if "latitude" in pkt:  self._labels["lat"].setText(f"{pkt['latitude']:.6f}")
-        if "longitude" in pkt: self._labels["lon"].setText(f"{pkt['longitude']:.6f}")
-        if "altitude" in pkt:  self._last_alt = float(pkt["altitude"]); self._labels["alt"].setText(f"{self._last_alt:.1f}")
-        if "mode" in pkt:      self._labels["mode"].setText(MODE_NAMES.get(int(pkt["mode"]), str(pkt["mode"])))
+        # queued connection delivers this on the UI thread; just merge and
+        # let the 15 Hz timer apply the latest value per field
+        self._pkt_cache.update(pkt)
+
+    def _apply_pkt_cache(self):
+        # drain the reader's latest-packet slot (single swap, no queued events)
+        st = self.serialThread
+        if st is not None:
+            latest = st.take_latest()
+            if latest:
+                self._pkt_cache.update(latest)
+        if not self._pkt_cache:
+            return
+        pkt, self._pkt_cache = self._pkt_cache, {}
+        if "latitude" in pkt:  self._set_text("lat", self._lbl_lat, f"{pkt['latitude']:.6f}")
+        if "longitude" in pkt: self._set_text("lon", self._lbl_lon, f"{pkt['longitude']:.6f}")
+        if "altitude" in pkt:  self._last_alt = float(pkt["altitude"]); self._set_text("alt", self._lbl_alt, f"{self._last_alt:.1f}")
+        if "mode" in pkt:      self._set_text("mode", self._lbl_mode, MODE_NAMES.get(int(pkt["mode"]), str(pkt["mode"])))
         if "armed" in pkt:
             armed = bool(pkt["armed"])
             self._update_banner(armed)
-            self._labels["arm"].setText("ARMED" if armed else "DISARMED")
+            self._set_text("arm", self._lbl_arm, "ARMED" if armed else "DISARMED")
         if "battery_voltage" in pkt:
-            v=float(pkt["battery_voltage"]); self._labels["bat"].setText(f"{v:.1f}")
-        if "remaining_minutes" in pkt: self._labels["remain"].setText(f"{float(pkt['remaining_minutes']):.1f}")
-        if "gps_sats" in pkt:   self._labels["sats"].setText(str(int(pkt["gps_sats"])))
-        if "gps_fix" in pkt:    self._labels["fix"].setText({0:"No Fix",2:"2D",3:"3D"}.get(int(pkt["gps_fix"]), str(pkt["gps_fix"])))
-        for k in ("pitch","roll","yaw"):
-            if k in pkt:
-                val=float(pkt[k]); self._labels[k].setText(f"{val:.1f}")
-                if k=="yaw": self._last_yaw_val = val
-        for k in ("vx","vy","vz"):
-            if k in pkt: self._labels[k].setText(f"{float(pkt[k]):.2f}")
+            v=float(pkt["battery_voltage"]); self._set_text("bat", self._lbl_bat, f"{v:.1f}")
+        if "remaining_minutes" in pkt: self._set_text("remain", self._lbl_remain, f"{float(pkt['remaining_minutes']):.1f}")
+        if "gps_sats" in pkt:   self._set_text("sats", self._lbl_sats, str(int(pkt["gps_sats"])))
+        if "gps_fix" in pkt:    self._set_text("fix", self._lbl_fix, {0:"No Fix",2:"2D",3:"3D"}.get(int(pkt["gps_fix"]), str(pkt["gps_fix"])))
+        if "pitch" in pkt: self._set_text("pitch", self._lbl_pitch, f"{float(pkt['pitch']):.1f}")
+        if "roll" in pkt:  self._set_text("roll", self._lbl_roll, f"{float(pkt['roll']):.1f}")
+        if "yaw" in pkt:
+            val = float(pkt["yaw"]); self._set_text("yaw", self._lbl_yaw, f"{val:.1f}"); self._last_yaw_val = val
+        if "vx" in pkt: self._set_text("vx", self._lbl_vx, f"{float(pkt['vx']):.2f}")
+        if "vy" in pkt: self._set_text("vy", self._lbl_vy, f"{float(pkt['vy']):.2f}")
+        if "vz" in pkt: self._set_text("vz", self._lbl_vz, f"{float(pkt['vz']):.2f}")
         if ("latitude" in pkt) and ("longitude" in pkt):
-            self.map.set_drone(float(pkt["latitude"]), float(pkt["longitude"]),
-                               yaw_deg=self._last_yaw_val, alt=self._last_alt,
-                               jump=self.follow_mode, trail=True)
-
-    @QtCore.Slot(str)
-    def _on_serial_line(self, text: str):
-        if text.startswith("[Serial error]"):
-            self._set_conn(-1)
-        else:
-            self._set_conn(1)
+            lat, lon = float(pkt["latitude"]), float(pkt["longitude"])
+            if self._latlon_changed(lat, lon):
+                self.map.set_drone(lat, lon,
+                                   yaw_deg=self._last_yaw_val, alt=self._last_alt,
+                                   jump=self.follow_mode, trail=True)
+                self._last_sent_lat, self._last_sent_lon = lat, lon
+
+    @QtCore.Slot(list)
+    def _on_serial_lines(self, lines: list):
+        # one queued event per reader tick; the last line wins the conn state
+        for text in lines:
+            self._set_conn(-1 if text.startswith("[Serial error]") else 1)
 
     def closeEvent(self, e: QtGui.QCloseEvent):
         if self.serialThread:
@@ -527,4 +753,4 @@ class MainWindow(QtWidgets.QMainWindow):
             self.map.maxBtn.setText("⤢")
             self.map.maxBtn.setToolTip("Maximize map")
             self._map_maximized = False
-        QtCore.QTimer.singleShot(0, lambda: self.map._run_js("invalidateMap();"))
+        QtCore.QTimer.singleShot(0, self.map._invalidate_map)
@@ -51,15 +51,14 @@ def resolve_webmap_mode(mode: str) -> bool:
     return have_internet() and tiles_reachable()
 
 def autodetect_port() -> str | None:
-    ports = list(list_ports.comports())
-    if not ports:
-        return None
-    for p in ports:
-        desc = (p.description or "").lower()
-        hwid = (p.hwid or "").lower()
-        if "ftdi" in desc or "usb" in desc or "ftdi" in hwid:
-            return p.device
-    return ports[0].device
+    # grep() regex-filters ports inside pyserial and yields lazily,
+    # so we stop at the first FTDI/USB hit
+    first = next(list_ports.grep("ftdi|usb"), None)
+    if first is not None:
+        return first.device
+    # full enumeration only when nothing matched
+    ports = list_ports.comports()
+    return ports[0].device if ports else None
 
 def main() -> int:
     # Windows taskbar grouping & name
@@ -132,15 +131,28 @@ def main() -> int:
     win.show()
 
     # Web map setting
-    use_web = resolve_webmap_mode(args.web_map)
-    try:
-        win.set_webmap_mode(args.web_map)
-    except Exception:
+    if args.web_map == "auto":
+        # Don't block first paint on the connectivity probes (~2.5s worst
+        # case); start offline and flip the map on when the worker reports.
         try:
-            win.map.use_web(use_web)
+            win.map.use_web(False)
         except Exception:
             pass
 
+        def _probe_webmap():
+            win.webmapResolved.emit(have_internet() and tiles_reachable())
+
+        QtCore.QThreadPool.globalInstance().start(_probe_webmap)
+    else:
+        use_web = resolve_webmap_mode(args.web_map)
+        try:
+            win.set_webmap_mode(args.web_map)
+        except Exception:
+            try:
+                win.map.use_web(use_web)
+            except Exception:
+                pass
+
     # Port selection
     port = args.port or autodetect_port()
     if not port:
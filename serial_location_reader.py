@@ -2,23 +2,48 @@ from __future__ import annotations
 from PySide6 import QtCore
 import serial, serial.tools.list_ports  # noqa: F401
 import json, time, re, os
-from datetime import datetime
+from binascii import hexlify
+from functools import lru_cache
 
 # --- small performance helpers ---
-_HEX = [f"{i:02X}" for i in range(256)]
-_ASCII_MAP = bytes([c if 32 <= c < 127 else ord(".") for c in range(256)])
+_ASCII_MAP = bytes((c if 32 <= c < 127 else 0x2E) for c in range(256))
 
+# staging buffers spill early past this size so memory stays bounded
+_SOFT_MAX_BUFFER_LEN = 64 * 1024
 
-def _ascii_gutter(b: bytes) -> str:
-    # translate() is in C, then ASCII decode
-    return b.translate(_ASCII_MAP).decode("ascii", "strict")
+# shared wall-clock format for log prefixes and session markers
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+
+# ".mmm " suffixes pre-rendered for every millisecond value
+_MS = [b".%03d " % i for i in range(1000)]
+
+# raw-bytes prefilter hints (mirror the str-level ones in
+# _parse_line_for_location); _B_PUSH is UTF-8 for U+1F4CD
+_B_LOC_HINTS = (b"ocation", b"OCATION", b"Lat", b"lat", b"LAT")
+_B_PUSH = b"\xf0\x9f\x93\x8d"
+_B_BRACE = b"{"
+
+# one C pass yields the non-empty lines of a chunk, CR/LF handled together
+_LINE_SPLIT = re.compile(rb"[^\r\n]+").findall
+
+
+def _ascii_gutter(b: bytes) -> bytes:
+    # translate() is in C; stay in bytes so no codec round-trip is paid
+    return b.translate(_ASCII_MAP)
+
+
+@lru_cache(maxsize=64)
+def _fast_float(s) -> float:
+    # a hovering drone repeats the same coordinate strings; the cache
+    # short-circuits the strtod parse for those
+    return float(s)
 
 
 class SerialLocationReader(QtCore.QThread):
     # Signals
     locationReceived = QtCore.Signal(float, float)
     telemetryReceived = QtCore.Signal(object)
-    lineReceived = QtCore.Signal(str)
+    linesReceived = QtCore.Signal(list)
 
     def __init__(
         self,
@@ -42,37 +67,57 @@ class SerialLocationReader(QtCore.QThread):
         self.binfile = binfile
         self.hexdump_path = hexdump
         self.hexwidth = max(8, int(hexwidth))
+        # hex column width resolved once
+        self._hex_pad = self.hexwidth * 3
 
         self._stop = False
         self._ser: serial.Serial | None = None
 
+        # latest merged telemetry; the GUI polls take_latest() at its own
+        # cadence instead of receiving one queued event per packet
+        self._latest_lock = QtCore.QMutex()
+        self._latest_pkt: dict = {}
+
         # opened once
         self._log_fp = None
         self._bin_fp = None
         self._hex_fp = None
         self._hex_addr = 0
 
+        # write coalescing: one write() per file per flush instead of per line
+        self._log_buf = bytearray()
+        self._bin_buf = bytearray()
+        self._hex_buf = bytearray()
+
+        # lines batched into one queued signal per tick instead of one
+        # QMetaCallEvent per line
+        self._pending_lines: list[str] = []
+
+        # per-second timestamp cache; only the millisecond suffix is computed
+        # per line
+        self._ts_sec = -1
+        self._ts_prefix = b""
+
+        # partial line carried across raw-chunk boundaries
+        self._partial_bytes = b""
+
         # flush throttling (less I/O CPU)
         self._flush_interval_ms = 250
         self._next_flush_t = time.perf_counter() + (self._flush_interval_ms / 1000.0)
 
-        # patterns (precompiled)
-        self._re_loc = re.compile(
-            r"Location:\s*([+-]?\d+(?:\.\d+)?)[,\s]+([+-]?\d+(?:\.\d+)?)",
-            re.I,
-        )
-        # literal U+1F4CD (📍), not surrogate pair
-        self._re_emoji_loc = re.compile(
-            r"\N{ROUND PUSHPIN}\s*Location:\s*([+-]?\d+(?:\.\d+)?)[,\s]+([+-]?\d+(?:\.\d+)?)",
-            re.I,
-        )
-        self._re_latlon_pair = re.compile(
-            r"Lat(?:itude)?:\s*([+-]?\d+(?:\.\d+)?)\D+Lon(?:gitude)?:\s*([+-]?\d+(?:\.\d+)?)",
-            re.I,
+        # single alternation covers "Location:", the U+1F4CD-prefixed form and
+        # Lat/Lon pairs: one scan per line instead of three
+        self._re_any = re.compile(
+            r"(?:\N{ROUND PUSHPIN}\s*)?Location:\s*(?P<lat1>[+-]?\d+(?:\.\d+)?)[,\s]+(?P<lon1>[+-]?\d+(?:\.\d+)?)"
+            r"|Lat(?:itude)?:\s*(?P<lat2>[+-]?\d+(?:\.\d+)?)\D+Lon(?:gitude)?:\s*(?P<lon2>[+-]?\d+(?:\.\d+)?)",
+            # ASCII: \d/\D become byte-range checks instead of Unicode lookups
+            re.I | re.A,
         )
+        # bound method skips the attribute lookup in the per-line hot path
+        self._search_loc = self._re_any.search
 
-        # JSON framing
-        self._json_buf = []
+        # JSON framing (bytearray: compact, and extend() is bulk C copies)
+        self._json_buf = bytearray()
         self._json_depth = 0
         self._json_in_string = False
         self._json_escape = False
@@ -81,6 +126,28 @@ class SerialLocationReader(QtCore.QThread):
     def stop(self):
         self._stop = True
 
+    # ------------- line handoff -------------
+    def _post_line(self, s: str):
+        # batched; _tick emits the accumulated list as a single event
+        self._pending_lines.append(s)
+
+    # ------------- telemetry handoff -------------
+    def _post_telemetry(self, pkt: dict):
+        self._latest_lock.lock()
+        try:
+            self._latest_pkt.update(pkt)
+        finally:
+            self._latest_lock.unlock()
+
+    def take_latest(self) -> dict:
+        """Swap out the merged telemetry accumulated since the last call."""
+        self._latest_lock.lock()
+        try:
+            pkt, self._latest_pkt = self._latest_pkt, {}
+        finally:
+            self._latest_lock.unlock()
+        return pkt
+
     # ------------- serial --------------
     def _open_serial(self):
         # small timeout; readline uses it as line timeout
@@ -95,32 +162,49 @@ class SerialLocationReader(QtCore.QThread):
                 os.makedirs(os.path.dirname(os.path.abspath(path)) or ".", exist_ok=True)
                 return open(path, mode, **kw)
         except Exception as e:
-            self.lineReceived.emit(f"[Serial error] failed to open {path}: {e}")
+            self._post_line(f"[Serial error] failed to open {path}: {e}")
         return None
 
     def _open_files(self):
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        ts = time.strftime(_TS_FMT)
         if self.logfile:
-            self._log_fp = self._safe_open(self.logfile, "a", encoding="utf-8", newline="")
+            # binary mode: lines are staged pre-encoded, no text-layer re-encode
+            self._log_fp = self._safe_open(self.logfile, "ab", buffering=1 << 16)
             if self._log_fp:
-                self._log_fp.write(f"=== LOG START {ts} ===\n")
-                self._log_fp.flush()
-                self.lineReceived.emit(f"[info] Logging to {os.path.abspath(self.logfile)}")
+                self._log_buf += f"=== LOG START {ts} ===\n".encode("utf-8")
+                self._post_line(f"[info] Logging to {os.path.abspath(self.logfile)}")
 
         if self.binfile:
-            self._bin_fp = self._safe_open(self.binfile, "ab")
+            self._bin_fp = self._safe_open(self.binfile, "ab", buffering=1 << 16)
             if self._bin_fp:
-                self.lineReceived.emit(f"[info] Binary capture -> {os.path.abspath(self.binfile)}")
+                self._post_line(f"[info] Binary capture -> {os.path.abspath(self.binfile)}")
 
         if self.hexdump_path:
-            self._hex_fp = self._safe_open(self.hexdump_path, "a", encoding="utf-8", newline="")
+            self._hex_fp = self._safe_open(self.hexdump_path, "ab", buffering=1 << 16)
             if self._hex_fp:
                 self._hex_addr = 0
-                self.lineReceived.emit(f"[info] Hex dump -> {os.path.abspath(self.hexdump_path)}")
+                self._post_line(f"[info] Hex dump -> {os.path.abspath(self.hexdump_path)}")
+
+    def _drain_buffers(self):
+        for fp, buf, name in (
+            (self._log_fp, self._log_buf, "logfile"),
+            (self._bin_fp, self._bin_buf, "binfile"),
+            (self._hex_fp, self._hex_buf, "hexdump"),
+        ):
+            if fp and buf:
+                try:
+                    fp.write(bytes(buf))
+                except Exception as e:
+                    self._post_line(f"[Serial error] {name} write failed: {e}")
+                buf.clear()
 
-    def _flush_if_due(self):
+    def _tick(self):
         now = time.perf_counter()
         if now >= self._next_flush_t:
+            if self._pending_lines:
+                batch, self._pending_lines = self._pending_lines, []
+                self.linesReceived.emit(batch)
+            self._drain_buffers()
             for fp in (self._log_fp, self._bin_fp, self._hex_fp):
                 try:
                     fp and fp.flush()
@@ -130,12 +214,10 @@ class SerialLocationReader(QtCore.QThread):
             self._next_flush_t = now + (self._flush_interval_ms / 1000.0)
 
     def _close_files(self):
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            if self._log_fp:
-                self._log_fp.write(f"=== LOG END {ts} ===\n")
-        except Exception:
-            pass
+        ts = time.strftime(_TS_FMT)
+        if self._log_fp:
+            self._log_buf += f"=== LOG END {ts} ===\n".encode("utf-8")
+        self._drain_buffers()
         for fp in (self._log_fp, self._bin_fp, self._hex_fp):
             try:
                 fp and fp.flush()
@@ -148,99 +230,148 @@ class SerialLocationReader(QtCore.QThread):
     def _log_text(self, s: str):
         if not self._log_fp:
             return
-        ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        try:
-            self._log_fp.write(f"{ts} {s}\n")
-        except Exception as e:
-            self.lineReceived.emit(f"[Serial error] logfile write failed: {e}")
+        t = time.time_ns()
+        sec = t // 1_000_000_000
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_prefix = time.strftime(
+                _TS_FMT, time.localtime(sec)
+            ).encode("ascii")
+        ms = (t // 1_000_000) % 1000
+        self._log_buf += self._ts_prefix + _MS[ms] + s.encode("utf-8", "replace") + b"\n"
+        if len(self._log_buf) > _SOFT_MAX_BUFFER_LEN:
+            self._drain_buffers()
 
     def _log_bin_and_hex(self, data: bytes):
         if not data:
             return
-        # raw bin (buffered; flush throttled)
+        # raw bin (staged; drained throttled)
         if self._bin_fp:
-            try:
-                self._bin_fp.write(data)
-            except Exception as e:
-                self.lineReceived.emit(f"[Serial error] binfile write failed: {e}")
+            self._bin_buf += data
 
-        # hexdump (continuous address; fast ASCII/HEX)
+        # hexdump (continuous address; fast ASCII/HEX, bytes end to end)
         if self._hex_fp:
             w = self.hexwidth
-            mv = memoryview(data)
-            n = len(mv)
+            pad = self._hex_pad
+            n = len(data)
+            addr = self._hex_addr
+            buf = self._hex_buf
             i = 0
-            # prebuild lines into a local list, then write once
-            out_lines = []
             while i < n:
-                chunk = mv[i : i + w]
-                hexs = " ".join(_HEX[b] for b in chunk)
-                asc = _ascii_gutter(chunk.tobytes())
-                out_lines.append(f"{self._hex_addr:08X}: {hexs:<{w*3}} |{asc}|")
-                self._hex_addr += len(chunk)
+                # plain bytes slicing: one memcpy, no memoryview/tobytes
+                # round-trip (and PyPy JIT-friendly)
+                chunk = data[i : i + w]
+                # hexlify with a separator stays in bytes (lowercase, which
+                # also skips an upper() pass per line)
+                hexs = hexlify(chunk, b" ")
+                asc = _ascii_gutter(chunk)
+                buf += b"%08x: %-*b |%b|\n" % (addr, pad, hexs, asc)
+                addr += len(chunk)
                 i += w
-            try:
-                self._hex_fp.write("\n".join(out_lines) + "\n")
-            except Exception as e:
-                self.lineReceived.emit(f"[Serial error] hexdump write failed: {e}")
+            self._hex_addr = addr
+
+        if len(self._bin_buf) > _SOFT_MAX_BUFFER_LEN or len(self._hex_buf) > _SOFT_MAX_BUFFER_LEN:
+            self._drain_buffers()
 
     # ------------- parsing -------------
     def _emit_latlon(self, lat: float, lon: float):
         self.locationReceived.emit(lat, lon)
-        self.telemetryReceived.emit({"latitude": lat, "longitude": lon})
+        self._post_telemetry({"latitude": lat, "longitude": lon})
 
     def _parse_line_for_location(self, line: str) -> bool:
-        m = self._re_loc.search(line) or self._re_emoji_loc.search(line)
-        if m:
-            try:
-                self._emit_latlon(float(m.group(1)), float(m.group(2)))
-                return True
-            except Exception:
-                return False
-        m2 = self._re_latlon_pair.search(line)
-        if m2:
-            try:
-                self._emit_latlon(float(m2.group(1)), float(m2.group(2)))
-                return True
-            except Exception:
-                return False
-        return False
+        # substring prefilter: most telemetry lines carry no location at all,
+        # and str.__contains__ is far cheaper than a regex scan
+        if (
+            "ocation" not in line and "OCATION" not in line
+            and "Lat" not in line and "lat" not in line and "LAT" not in line
+        ):
+            return False
+        m = self._search_loc(line)
+        if not m:
+            return False
+        try:
+            lat = m.group("lat1") or m.group("lat2")
+            lon = m.group("lon1") or m.group("lon2")
+            self._emit_latlon(_fast_float(lat), _fast_float(lon))
+            return True
+        except Exception:
+            return False
 
     # robust multiline JSON framing with brace depth (ignores braces inside strings)
     def _feed_json_line(self, line: str):
         if not line:
             return
 
-        # Fast path: whole object on one line
+        # Fast path: whole object on one line. Trailing whitespace is checked
+        # by index instead of rstrip() so no copy is allocated, and objects
+        # without a key separator never reach json.loads.
         s = line.lstrip()
-        if s.startswith("{") and s.rstrip().endswith("}"):
-            try:
-                obj = json.loads(line)
-            except Exception:
+        if s[:1] == "{":
+            i = len(s)
+            while i and s[i - 1] in " \t\r\n":
+                i -= 1
+            if i and s[i - 1] == "}" and ":" in s:
+                try:
+                    obj = json.loads(s)
+                except Exception:
+                    return
+                self._emit_json(obj)
                 return
-            self._emit_json(obj)
-            return
 
-        # Streaming path
-        for ch in line:
-            if self._json_in_string:
-                if self._json_escape:
-                    self._json_escape = False
-                elif ch == "\\":
-                    self._json_escape = True
-                elif ch == '"':
-                    self._json_in_string = False
+        # Streaming path: jump between structural chars with str.find (C-level
+        # scans) instead of ticking the interpreter once per character
+        find = line.find
+        n = len(line)
+        i = 0
+        depth = self._json_depth
+        in_str = self._json_in_string
+        esc = self._json_escape
+        while i < n:
+            if in_str:
+                if esc:
+                    i += 1
+                    esc = False
+                    continue
+                q = find('"', i)
+                b = find("\\", i)
+                if b != -1 and (q == -1 or b < q):
+                    # skip the escape pair; it may straddle the line end
+                    if b + 1 < n:
+                        i = b + 2
+                    else:
+                        i = n
+                        esc = True
+                elif q == -1:
+                    i = n
+                else:
+                    in_str = False
+                    i = q + 1
             else:
+                q = find('"', i)
+                o = find("{", i)
+                c = find("}", i)
+                m = n
+                if q != -1 and q < m: m = q
+                if o != -1 and o < m: m = o
+                if c != -1 and c < m: m = c
+                if m == n:
+                    break
+                ch = line[m]
                 if ch == '"':
-                    self._json_in_string = True
+                    in_str = True
                 elif ch == "{":
-                    self._json_depth += 1
-                elif ch == "}":
-                    self._json_depth -= 1
-            self._json_buf.append(ch)
+                    depth += 1
+                else:
+                    depth -= 1
+                i = m + 1
+        self._json_depth = depth
+        self._json_in_string = in_str
+        self._json_escape = esc
+        # bulk append: whole-line slices, never per-char pieces
+        self._json_buf += line.encode("utf-8")
 
         if self._json_depth == 0 and self._json_buf:
-            payload = "".join(self._json_buf).strip()
+            payload = bytes(self._json_buf).decode("utf-8", "replace").strip()
             self._json_buf.clear()
             self._json_in_string = False
             self._json_escape = False
@@ -279,10 +410,10 @@ class SerialLocationReader(QtCore.QThread):
             pkt["longitude"] = obj["lon"]
 
         if pkt:
-            self.telemetryReceived.emit(pkt)
+            self._post_telemetry(pkt)
             if "latitude" in pkt and "longitude" in pkt:
                 try:
-                    self.locationReceived.emit(float(pkt["latitude"]), float(pkt["longitude"]))
+                    self.locationReceived.emit(_fast_float(pkt["latitude"]), _fast_float(pkt["longitude"]))
                 except Exception:
                     pass
 
@@ -292,62 +423,111 @@ class SerialLocationReader(QtCore.QThread):
             self._open_files()
             self._open_serial()
         except Exception as e:
-            self.lineReceived.emit(f"[Serial error] open failed: {e}")
+            self._post_line(f"[Serial error] open failed: {e}")
             self._close_files()
+            # surface the error even though the loop never ran
+            self._next_flush_t = 0.0
+            self._tick()
             return
 
-        self.lineReceived.emit(f"[info] Serial started on {self.port} @ {self.baud}")
+        self._post_line(f"[info] Serial started on {self.port} @ {self.baud}")
+
+        # hot-loop locals: LOAD_FAST beats repeated LOAD_ATTR chains.
+        # self._stop and self._json_depth are left as attributes because they
+        # mutate while the loop runs.
+        log_bh = self._log_bin_and_hex
+        log_text = self._log_text
+        post_line = self._post_line
+        parse_loc = self._parse_line_for_location
+        feed_json = self._feed_json_line
+        tick = self._tick
+        log_fp = self._log_fp
 
         try:
             if self.lines:
-                # newline-terminated input
+                # newline-terminated input, batch-drained: read every byte
+                # already waiting in one syscall instead of one read() per
+                # line; timeout=0.2 keeps idle polls returning
+                ser = self._ser
+                read = ser.read
                 while not self._stop:
                     try:
-                        raw = self._ser.readline()
+                        raw = read(ser.in_waiting or 1)
                     except Exception as e:
-                        self.lineReceived.emit(f"[Serial error] {e}")
+                        post_line(f"[Serial error] {e}")
                         break
                     if not raw:
-                        self._flush_if_due()
+                        tick()
                         continue
 
-                    self._log_bin_and_hex(raw)
-
-                    # fast decode
-                    line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
-                    if line:
-                        self._log_text(line)
-                        self.lineReceived.emit(line)
-                        # cheap location first, then JSON
-                        if not self._parse_line_for_location(line):
-                            self._feed_json_line(line)
+                    log_bh(raw)
 
-                    self._flush_if_due()
+                    buf = self._partial_bytes + raw
+                    cut = buf.rfind(b"\n")
+                    if cut < 0:
+                        # no complete line yet; don't hoard unterminated data
+                        self._partial_bytes = b"" if len(buf) > _SOFT_MAX_BUFFER_LEN else buf
+                        tick()
+                        continue
+                    self._partial_bytes = buf[cut + 1:]
+                    for lb in _LINE_SPLIT(buf, 0, cut):
+                        # prefilter on raw bytes: skip UTF-8 decode entirely
+                        # unless the line can matter (location/JSON candidate,
+                        # open JSON frame, or an active text log)
+                        if (
+                            log_fp is not None
+                            or self._json_depth
+                            or _B_BRACE in lb
+                            or _B_PUSH in lb
+                            or any(h in lb for h in _B_LOC_HINTS)
+                        ):
+                            line = lb.decode("utf-8", errors="replace")
+                            log_text(line)
+                            post_line(line)
+                            # cheap location first, then JSON (only when a
+                            # brace is present or we're mid-object)
+                            if not parse_loc(line):
+                                if self._json_depth or "{" in line:
+                                    feed_json(line)
+
+                    tick()
             else:
                 # raw chunk mode
+                read = self._ser.read
+                chunk_size = self.chunk
                 while not self._stop:
                     try:
-                        data = self._ser.read(self.chunk)
+                        data = read(chunk_size)
                     except Exception as e:
-                        self.lineReceived.emit(f"[Serial error] {e}")
+                        post_line(f"[Serial error] {e}")
                         break
                     if not data:
-                        self._flush_if_due()
+                        tick()
                         continue
 
-                    self._log_bin_and_hex(data)
-
-                    # opportunistic text parsing
-                    txt = data.decode("utf-8", errors="ignore")
-                    if txt:
-                        # normalize CRLF -> LF once
-                        for ln in filter(None, txt.replace("\r", "").split("\n")):
-                            self._log_text(ln)
-                            self.lineReceived.emit(ln)
-                            if not self._parse_line_for_location(ln):
-                                self._feed_json_line(ln)
+                    log_bh(data)
 
-                    self._flush_if_due()
+                    # opportunistic text parsing; one C pass splits the chunk
+                    # and the trailing partial line carries to the next chunk
+                    buf = self._partial_bytes + data
+                    cut = buf.rfind(b"\n")
+                    if cut < 0:
+                        # pure binary stream with no newlines; don't hoard it
+                        self._partial_bytes = b"" if len(buf) > _SOFT_MAX_BUFFER_LEN else buf
+                        tick()
+                        continue
+                    self._partial_bytes = buf[cut + 1:]
+                    for lb in _LINE_SPLIT(buf, 0, cut):
+                        ln = lb.decode("utf-8", "ignore")
+                        if not ln:
+                            continue
+                        log_text(ln)
+                        post_line(ln)
+                        if not parse_loc(ln):
+                            if self._json_depth or "{" in ln:
+                                feed_json(ln)
+
+                    tick()
 
         finally:
             try:
@@ -356,5 +536,5 @@ class SerialLocationReader(QtCore.QThread):
                 pass
             # final flush/close
             self._next_flush_t = 0.0
-            self._flush_if_due()
+            self._tick()
             self._close_files()